@@ -1,12 +1,18 @@
-from lib.config import load_config
-from lib.storage.local import LocalStorage
-from lib.fetchers.entrez.pubmed.client import PubMedClient
-from lib.fetchers.entrez.pubmed.models import PubMedArticle
-from lib.utils.rate_limit import rate_limit
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Ilja Krestjancevs"
 
+# Re-exports are resolved lazily (PEP 562) so importing the package stays
+# cheap until a heavyweight component is actually used.
+_LAZY_IMPORTS = {
+    "load_config": "lib.config",
+    "LocalStorage": "lib.storage.local",
+    "PubMedClient": "lib.fetchers.entrez.pubmed.client",
+    "PubMedArticle": "lib.fetchers.entrez.pubmed.models",
+    "rate_limit": "lib.utils.rate_limit",
+}
+
 __all__ = [
     "load_config",
     "LocalStorage",
@@ -14,3 +20,12 @@ __all__ = [
     "PubMedArticle",
     "rate_limit",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
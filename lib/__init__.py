@@ -1,13 +1,29 @@
-from .config import load_config
-from .storage.local import LocalStorage
-from .fetchers.entrez.pubmed.client import PubMedClient
-from .processors.article_processor import ArticleProcessor
+import importlib
 
 __version__ = "0.1.0"
 
+# Re-exports are resolved lazily (PEP 562) so that `import lib` or
+# `from lib import load_config` doesn't drag in aiohttp and the fetcher
+# stack when only config or storage is needed.
+_LAZY_IMPORTS = {
+    "load_config": ".config",
+    "LocalStorage": ".storage.local",
+    "PubMedClient": ".fetchers.entrez.pubmed.client",
+    "ArticleProcessor": ".processors.article_processor",
+}
+
 __all__ = [
     "load_config",
     "LocalStorage",
     "PubMedClient",
     "ArticleProcessor",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
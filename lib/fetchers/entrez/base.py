@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar, TYPE_CHECKING
+import asyncio
+
+if TYPE_CHECKING:
+    from typing import List, Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class BaseArticle:
     """
     Base class for representing scientific articles from various sources.
@@ -18,7 +24,9 @@ class BaseArticle:
         authors (List[str]): List of author names
         doi (Optional[str]): Digital Object Identifier
         source_id (str): Identifier specific to the source system (e.g., PMID for PubMed)
-        source_type (str): Identifier for the source system (e.g., "pubmed", "arxiv")
+        source_type (ClassVar[str]): Identifier for the source system
+                                     (e.g., "pubmed", "arxiv"), set once per
+                                     subclass rather than stored per instance
         published_date (datetime): Publication date
 
     Example:
@@ -28,22 +36,28 @@ class BaseArticle:
         ...     authors=["Smith, J", "Doe, J"],
         ...     doi="10.1234/example",
         ...     source_id="12345678",
-        ...     source_type="pubmed",
         ...     published_date=datetime.now()
         ... )
     """
+    source_type: ClassVar[str] = ""
+
     title: str
     abstract: str
     authors: List[str]
     doi: Optional[str]
     source_id: str
-    source_type: str
     published_date: datetime
+    _published_iso: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the article to a dictionary representation.
 
+        The ISO-formatted publication date is computed once and cached, so
+        repeated serialization of the same article doesn't re-run
+        datetime.isoformat().
+
         Returns:
             Dict[str, Any]: Dictionary containing all article fields, with
                            published_date converted to ISO format string
@@ -54,6 +68,11 @@ class BaseArticle:
             >>> print(article_dict['title'])
             >>> print(article_dict['published_date'])  # ISO format string
         """
+        published_iso = self._published_iso
+        if published_iso is None:
+            published_iso = self.published_date.isoformat()
+            self._published_iso = published_iso
+
         return {
             'title': self.title,
             'abstract': self.abstract,
@@ -61,7 +80,7 @@ class BaseArticle:
             'doi': self.doi,
             'source_id': self.source_id,
             'source_type': self.source_type,
-            'published_date': self.published_date.isoformat(),
+            'published_date': published_iso,
         }
 
 class BaseFetcher(ABC):
@@ -145,8 +164,10 @@ class BaseFetcher(ABC):
         """
         Fetch multiple articles by their identifiers.
 
-        This is a default implementation that fetches articles sequentially.
-        Subclasses may override this with more efficient batch operations.
+        This default implementation fetches articles concurrently with
+        asyncio.gather, letting per-request rate limiting overlap with
+        network waits. Subclasses may override this with more efficient
+        batch operations (e.g. a single multi-id API request).
 
         Args:
             article_ids (List[str]): List of article identifiers
@@ -162,7 +183,6 @@ class BaseFetcher(ABC):
             ...     if article:
             ...         print(f"{article_id}: {article.title}")
         """
-        results = {}
-        for article_id in article_ids:
-            results[article_id] = await self.fetch_by_id(article_id)
-        return results
\ No newline at end of file
+        coros = [self.fetch_by_id(article_id) for article_id in article_ids]
+        fetched = await asyncio.gather(*coros, return_exceptions=True)
+        return dict(zip(article_ids, fetched))
\ No newline at end of file
@@ -1,24 +1,30 @@
+from __future__ import annotations
+
+import html
+import json
 import re
 import logging
-from typing import List, Optional, Dict, Any
-from Bio import Entrez
+import xml.etree.ElementTree as ET
+from functools import cached_property
+from typing import TYPE_CHECKING
 import asyncio
-import aiohttp
+
+if TYPE_CHECKING:
+    from typing import List, Optional, Dict, Any, Tuple
 
 from lib.config import PubMedConfig
 
 from ....fetchers.entrez.base import BaseFetcher
 from .models import PubMedArticle
-from ....utils.rate_limit import rate_limit
-
-try:
-    from pymed import PubMed
-except ImportError:
-    print("Please install pymed using: pip install pymed")
-    raise
+from .parsers import PubMedXMLParser
+from ....utils.disk_cache import DiskCache
+from ....utils.lru import LRUCache
+from ....utils.rate_limit import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
 
 class PubMedClient(BaseFetcher):
     """
@@ -32,7 +38,6 @@ class PubMedClient(BaseFetcher):
         BASE_URL (str): Base URL for NCBI E-utilities API
         tool (str): Name of the tool making the request (required by NCBI)
         email (str): Email address for API access (required by NCBI)
-        pubmed (PubMed): PubMed client instance from pymed library
         request_delay (float): Delay between consecutive requests for rate limiting
 
     Examples:
@@ -41,61 +46,267 @@ class PubMedClient(BaseFetcher):
         >>> articles = await client.search("cancer therapy", max_results=10)
     """
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    EFETCH_BATCH_SIZE = 200
 
-    def __init__(self, config: PubMedConfig):
+    def __init__(self, config: PubMedConfig,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the PubMedClient with the given configuration.
 
         Args:
             config (PubMedConfig): Configuration object containing tool name, email, and other settings
+            cache_dir (Optional[str], optional): Directory for a persistent
+                response cache. When set, EFetch/ESummary/PDF responses are
+                memoized on disk keyed by PMID, so repeated runs skip the
+                network entirely. Defaults to None (no caching).
         """
         self.tool = config.tool
         self.email = config.email
-
-        self.pubmed = PubMed(
-            tool=self.tool,
-            email=self.email,
-        )
+        self.api_key = config.api_key
 
         self.request_delay = config.request_delay
+        self.max_retries = config.max_retries
+        self._session = None
+        self._cache = DiskCache(cache_dir) if cache_dir else None
+
+        # Per-run memoization of parse results: a PMID that turns up in
+        # several queries (or is retried) is parsed once, then served from
+        # memory. The event loop is single-threaded and these caches are
+        # never touched across an await, so no lock is needed.
+        self._article_cache = LRUCache(maxsize=4096)
+        self._summary_cache = LRUCache(maxsize=4096)
+
+        # NCBI enforces its request quota per key/IP, not per endpoint, so
+        # every E-utilities call shares one bucket instead of one limiter
+        # per decorated method. An API key raises the quota to 10 req/s.
+        if self.api_key:
+            rate = 10.0
+        else:
+            rate = 1.0 / self.request_delay if self.request_delay > 0 else 3.0
+        self._eutils_limiter = AsyncTokenBucket(rate=rate, capacity=3)
+
         logger.debug(f"PubMedClient initialized with request_delay: {
                      self.request_delay}")
 
-        Entrez.email = config.email
+    async def _get_session(self):
+        """
+        Get the shared aiohttp session, creating it lazily on first use.
+
+        Reusing a single session lets aiohttp pool TCP/TLS connections to
+        the NCBI hosts instead of performing a fresh handshake per request.
+        The pool is sized to NCBI's 10 req/s ceiling with a per-host cap so
+        gathered batches (e.g. batch_fetch_pdfs) keep connections alive
+        instead of flooding pmc.ncbi.nlm.nih.gov and tripping throttling.
 
-    def _get_base_params(config) -> Dict[str, str]:
+        Returns:
+            aiohttp.ClientSession: Shared client session
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=5,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
         """
-        Get base parameters required for PubMed API requests.
+        Close the shared aiohttp session if one was created.
+
+        Example:
+            >>> client = PubMedClient(config)
+            >>> try:
+            ...     await client.fetch_xml("12345678")
+            ... finally:
+            ...     await client.close()
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
-        Args:
-            config: Configuration object containing tool and email information
+    async def __aenter__(self) -> 'PubMedClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @cached_property
+    def _base_params(self) -> Dict[str, str]:
+        """
+        Base parameters required for PubMed API requests.
+
+        Built once per client instance; callers merge it into their
+        per-request parameter dicts.
 
         Returns:
             Dict[str, str]: Dictionary containing base parameters for API requests
         """
-        return {
-            'tool': config.tool,
-            'email': config.email
+        params = {
+            'tool': self.tool,
+            'email': self.email
         }
+        if self.api_key:
+            params['api_key'] = self.api_key
+        return params
 
     @staticmethod
     def clean_html_tags(text: str) -> str:
         """
-        Remove HTML tags from the given text.
+        Remove HTML tags and decode HTML entities in the given text.
+
+        PubMed abstracts carry markup like <i>, <sub>, <sup> plus entities
+        such as &amp;; stripping tags alone would leave the entities broken.
+
+        Args:
+            text (str): Text containing HTML tags and entities
+
+        Returns:
+            str: Clean text with tags removed and entities decoded
+        """
+        if not text:
+            return ""
+        return html.unescape(_HTML_TAG_RE.sub("", text))
+
+    async def _get_with_retries(self, url: str,
+                                params: Optional[Dict[str, str]] = None,
+                                headers: Optional[Dict[str, str]] = None,
+                                use_limiter: bool = True) -> Optional[bytes]:
+        """
+        Perform a GET request, retrying transient failures with backoff.
+
+        Retries up to max_retries times on 429/5xx responses, connection
+        errors, and timeouts, sleeping an exponentially growing delay
+        (capped at 8s) between attempts and honoring a Retry-After header
+        when NCBI sends one. Non-transient statuses fail immediately.
+        Every attempt is paced through the shared E-utilities token
+        bucket unless use_limiter is False (e.g. PMC PDF downloads).
+
+        Args:
+            url (str): URL to request
+            params (Optional[Dict[str, str]], optional): Query parameters.
+                Defaults to None.
+            headers (Optional[Dict[str, str]], optional): Request headers.
+                Defaults to None.
+            use_limiter (bool, optional): Acquire the E-utilities rate
+                limiter before each attempt. Defaults to True.
+
+        Returns:
+            Optional[bytes]: Response body on a 200 response, None if all
+                attempts failed or a non-retryable status was returned
+        """
+        import aiohttp
+
+        for attempt in range(self.max_retries + 1):
+            if use_limiter:
+                await self._eutils_limiter.acquire()
+            session = await self._get_session()
+            try:
+                async with session.get(url, params=params,
+                                       headers=headers) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    if (response.status == 429 or response.status >= 500) \
+                            and attempt < self.max_retries:
+                        delay = min(8.0, 0.5 * (2 ** attempt))
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after:
+                            try:
+                                delay = max(delay, float(retry_after))
+                            except ValueError:
+                                pass
+                        logger.warning(f"Got status {response.status} from {
+                                       url}; retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    logger.error(f"Request to {url} failed with status {
+                                 response.status}")
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    delay = min(8.0, 0.5 * (2 ** attempt))
+                    logger.warning(f"Transient error for {url}: {
+                                   e}; retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Request to {url} failed after {
+                             attempt + 1} attempts: {e}")
+                return None
+        return None
+
+    async def _esearch(self, query: str, max_results: Optional[int] = None) -> List[str]:
+        """
+        Run an ESearch query and return the matching PMIDs.
 
         Args:
-            text (str): Text containing HTML tags
+            query (str): Search query string following PubMed query syntax
+            max_results (Optional[int]): Maximum number of PMIDs to return.
+                                         If None, NCBI's default page size applies
+
+        Returns:
+            List[str]: PMIDs matching the query, empty on error
+        """
+        url = f"{self.BASE_URL}/esearch.fcgi"
+        params = {
+            **self._base_params,
+            'db': 'pubmed',
+            'term': query,
+            'retmode': 'json'
+        }
+        if max_results is not None:
+            params['retmax'] = str(max_results)
+
+        content = await self._get_with_retries(url, params=params)
+        if content is None:
+            logger.error("Failed to search PubMed")
+            return []
+        try:
+            data = json.loads(content)
+        except Exception as e:
+            logger.error(f"Error during PubMed esearch: {e}")
+            return []
+        return data.get('esearchresult', {}).get('idlist', [])
+
+    @staticmethod
+    def _parse_article_set(xml_content: bytes) -> List[PubMedArticle]:
+        """
+        Split a multi-article PubmedArticleSet into PubMedArticle instances.
+
+        Streams the document with PubMedXMLParser.iter_pubmed_articles, so
+        a multi-MB EFetch response is parsed in one pass at constant memory
+        instead of being split into per-article documents and re-parsed.
+
+        Args:
+            xml_content (bytes): XML returned by a (batched) EFetch request
 
         Returns:
-            str: Clean text with HTML tags removed
+            List[PubMedArticle]: Parsed articles; entries that fail to parse
+                                 are logged and skipped
         """
-        return re.sub(r"<.*?>", "", text) if text else ""
+        articles = []
+        try:
+            for metadata in PubMedXMLParser.iter_pubmed_articles(xml_content):
+                try:
+                    articles.append(PubMedArticle.from_metadata(metadata))
+                except Exception as e:
+                    logger.error(f"Error processing article: {e}")
+        except Exception as e:
+            logger.error(f"Error parsing article set XML: {e}")
+        return articles
 
-    @rate_limit()
     async def search(self, query: str, max_results: Optional[int] = None) -> List[PubMedArticle]:
         """
         Search PubMed database with the given query.
 
+        Runs ESearch to collect matching PMIDs, then retrieves the articles
+        with batched EFetch calls. This parses each article's XML exactly
+        once, instead of round-tripping through pymed's own article objects.
+
         Args:
             query (str): Search query string following PubMed query syntax
             max_results (Optional[int]): Maximum number of results to return. If None, returns all results
@@ -112,16 +323,16 @@ class PubMedClient(BaseFetcher):
             ...     print(article.title)
         """
         try:
-            raw_results = self.pubmed.query(query, max_results=max_results)
-            results = []
+            pmids = await self._esearch(query, max_results=max_results)
+            if not pmids:
+                return []
 
-            for article in raw_results:
-                try:
-                    pubmed_article = PubMedArticle.from_pymed_article(article)
-                    results.append(pubmed_article)
-                except Exception as e:
-                    logger.error(f"Error processing article: {e}")
-                    continue
+            results = []
+            for start in range(0, len(pmids), self.EFETCH_BATCH_SIZE):
+                chunk = pmids[start:start + self.EFETCH_BATCH_SIZE]
+                xml_content = await self.fetch_xml_batch(chunk)
+                if xml_content:
+                    results.extend(self._parse_article_set(xml_content))
 
             return results
 
@@ -129,13 +340,12 @@ class PubMedClient(BaseFetcher):
             logger.error(f"Error during PubMed search: {e}")
             return []
 
-    @rate_limit()
     async def fetch_by_id(self, article_id: str) -> Optional[PubMedArticle]:
         """
         Fetch a specific article by its PubMed ID (PMID).
 
         This method first attempts to fetch the article using XML format, and if that fails,
-        falls back to using the PyMed library.
+        falls back to a PMID-scoped search.
 
         Args:
             article_id (str): PubMed ID (PMID) of the article
@@ -151,21 +361,57 @@ class PubMedClient(BaseFetcher):
             >>> if article:
             ...     print(f"Title: {article.title}")
         """
+        cached = self._article_cache.get(article_id)
+        if cached is not None:
+            logger.debug(f"Article cache hit for PMID {article_id} "
+                         f"({self._article_cache.hits} hits, "
+                         f"{self._article_cache.misses} misses)")
+            return cached
+
+        article, _ = await self.fetch_by_id_with_xml(article_id)
+        if article is not None:
+            self._article_cache.put(article_id, article)
+        return article
+
+    async def fetch_by_id_with_xml(
+            self, article_id: str
+    ) -> Tuple[Optional[PubMedArticle], Optional[bytes]]:
+        """
+        Fetch an article and its raw EFetch XML with one request.
+
+        Callers that need both the parsed article and the XML it came from
+        (e.g. the processor, which stores the XML-derived metadata) get
+        them from a single EFetch round-trip instead of fetching the same
+        PMID twice and paying the rate-limit budget for it.
+
+        Args:
+            article_id (str): PubMed ID (PMID) of the article
+
+        Returns:
+            Tuple[Optional[PubMedArticle], Optional[bytes]]: The parsed
+                article (or None) and the raw XML bytes (or None if the
+                EFetch call failed)
+
+        Examples:
+            >>> article, raw_xml = await client.fetch_by_id_with_xml("12345678")
+            >>> if article:
+            ...     print(f"Title: {article.title}, XML bytes: {len(raw_xml)}")
+        """
+        xml_content = None
         try:
             xml_content = await self.fetch_xml(article_id)
             if xml_content:
                 try:
-                    return PubMedArticle.from_xml(xml_content)
+                    return PubMedArticle.from_xml(xml_content), xml_content
                 except Exception as e:
                     logger.error(f"Error parsing XML for {article_id}: {e}")
 
             results = await self.search(f"{article_id}[pmid]", max_results=1)
-            return results[0] if results else None
+            return (results[0] if results else None), xml_content
         except Exception as e:
             logger.error(f"Error fetching article {article_id}: {e}")
-            return None
+            return None, xml_content
 
-    @rate_limit(delay=0.01)
     async def fetch_pdf(self, article_id: str) -> Optional[bytes]:
         """
         Attempt to fetch the PDF version of an article from PubMed Central (PMC).
@@ -188,21 +434,41 @@ class PubMedClient(BaseFetcher):
             ...     with open("article.pdf", "wb") as f:
             ...         f.write(pdf_content)
         """
+        if self._cache is not None:
+            cached = self._cache.get('pdf', article_id)
+            if cached is not None:
+                return cached
+
         try:
-            handle = Entrez.elink(dbfrom="pubmed", db="pmc",
-                                  id=article_id, linkname="pubmed_pmc")
-            records = Entrez.read(handle)
-            handle.close()
+            elink_url = f"{self.BASE_URL}/elink.fcgi"
+            elink_params = {
+                **self._base_params,
+                'dbfrom': 'pubmed',
+                'db': 'pmc',
+                'id': article_id,
+                'linkname': 'pubmed_pmc',
+                'retmode': 'json'
+            }
 
-            if not records[0].get("LinkSetDb"):
+            content = await self._get_with_retries(
+                elink_url, params=elink_params)
+            if content is None:
+                logger.error(f"Failed to fetch PMC links for PMID {
+                             article_id}")
+                return None
+            data = json.loads(content)
+
+            linksets = data.get("linksets", [])
+            linksetdbs = linksets[0].get("linksetdbs", []) if linksets else []
+            if not linksetdbs:
                 logger.info(f"No PMC record found for PMID {article_id}")
                 return None
 
-            pmc_links = records[0]["LinkSetDb"][0].get("Link", [])
+            pmc_links = linksetdbs[0].get("links", [])
             if not pmc_links:
                 return None
 
-            pmc_id = pmc_links[0]["Id"]
+            pmc_id = pmc_links[0]
             pdf_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{pmc_id}/pdf/"
 
             headers = {
@@ -210,33 +476,34 @@ class PubMedClient(BaseFetcher):
                 "Accept": "application/pdf",
             }
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(pdf_url) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    elif response.status in {301, 302}:
-                        logger.warning(
-                            f"Redirect encountered. Final URL: {response.url}")
-                        return await response.read()
-                    else:
-                        logger.warning(
-                            f"Unexpected response for {pdf_url}: {response.status}")
-                        return None
+            # The PDF lives on PMC, not E-utilities, so its download does
+            # not draw from the shared rate-limit bucket.
+            pdf_content = await self._get_with_retries(
+                pdf_url, headers=headers, use_limiter=False)
+            if pdf_content is None:
+                logger.warning(f"Failed to download PDF from {pdf_url}")
+                return None
+            if self._cache is not None:
+                self._cache.set('pdf', article_id, pdf_content)
+            return pdf_content
 
         except Exception as e:
             logger.error(f"Error fetching PDF for PMID {article_id}: {e}")
             return None
 
-    @rate_limit()
-    async def fetch_xml(self, pmid: str) -> Optional[str]:
+    async def fetch_xml(self, pmid: str) -> Optional[bytes]:
         """
         Fetch the XML representation of an article from PubMed.
 
+        The raw response bytes are returned without a Python-level decode;
+        the XML parser reads the encoding from the XML declaration itself,
+        which avoids holding both a bytes and a str copy of large documents.
+
         Args:
             pmid (str): PubMed ID (PMID) of the article
 
         Returns:
-            Optional[str]: XML content as string if successful, None otherwise
+            Optional[bytes]: XML content as bytes if successful, None otherwise
 
         Raises:
             Exception: If there's an error fetching the XML
@@ -246,27 +513,151 @@ class PubMedClient(BaseFetcher):
             >>> if xml_content:
             ...     print("XML length:", len(xml_content))
         """
+        if self._cache is not None:
+            cached = self._cache.get('efetch', pmid)
+            if cached is not None:
+                return cached
+
         url = f"{self.BASE_URL}/efetch.fcgi"
         params = {
-            **self._get_base_params(),
+            **self._base_params,
             'db': 'pubmed',
             'id': pmid,
             'retmode': 'xml',
             'rettype': 'full'
         }
 
-        async with aiohttp.ClientSession() as session:
+        content = await self._get_with_retries(url, params=params)
+        if content is None:
+            logger.error(f"Failed to fetch XML for PMID {pmid}")
+            return None
+        if self._cache is not None:
+            self._cache.set('efetch', pmid, content)
+        return content
+
+    async def fetch_xml_batch(self, pmids: List[str]) -> Optional[bytes]:
+        """
+        Fetch the XML for multiple articles with a single EFetch request.
+
+        NCBI's efetch endpoint accepts a comma-separated id list and returns
+        one multi-article PubmedArticleSet document, so a batch of PMIDs
+        costs a single rate-limited round-trip instead of one per id.
+
+        Args:
+            pmids (List[str]): PubMed IDs (PMIDs) to fetch. Should contain at
+                               most EFETCH_BATCH_SIZE ids per NCBI guidance.
+
+        Returns:
+            Optional[bytes]: Multi-article XML content as bytes if successful, None otherwise
+
+        Examples:
+            >>> xml_content = await client.fetch_xml_batch(["12345678", "87654321"])
+            >>> if xml_content:
+            ...     print("XML length:", len(xml_content))
+        """
+        url = f"{self.BASE_URL}/efetch.fcgi"
+        params = {
+            **self._base_params,
+            'db': 'pubmed',
+            'id': ','.join(pmids),
+            'retmode': 'xml',
+            'rettype': 'full'
+        }
+
+        content = await self._get_with_retries(url, params=params)
+        if content is None:
+            logger.error(f"Failed to fetch XML batch of {len(pmids)} PMIDs")
+        return content
+
+    async def fetch_many_xml(self, pmids: List[str]) -> Dict[str, bytes]:
+        """
+        Fetch raw XML for many PMIDs using batched EFetch requests.
+
+        PMIDs are chunked into groups of EFETCH_BATCH_SIZE, each group is
+        retrieved with one fetch_xml_batch call, and the combined
+        PubmedArticleSet is demultiplexed into one single-article document
+        per PMID. N articles cost N / EFETCH_BATCH_SIZE HTTP round-trips
+        instead of N.
+
+        Args:
+            pmids (List[str]): PubMed IDs (PMIDs) to fetch
+
+        Returns:
+            Dict[str, bytes]: Mapping of PMID to its single-article
+                             PubmedArticleSet XML; PMIDs missing from the
+                             responses are absent from the dict
+
+        Examples:
+            >>> xml_by_pmid = await client.fetch_many_xml(["12345678", "87654321"])
+            >>> for pmid, xml_content in xml_by_pmid.items():
+            ...     print(pmid, len(xml_content))
+        """
+        results: Dict[str, bytes] = {}
+
+        for start in range(0, len(pmids), self.EFETCH_BATCH_SIZE):
+            chunk = pmids[start:start + self.EFETCH_BATCH_SIZE]
+            xml_content = await self.fetch_xml_batch(chunk)
+            if not xml_content:
+                continue
+
             try:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.error(f"Failed to fetch XML for PMID {
-                                     pmid}. Status: {response.status}")
-                        return None
-            except Exception as e:
-                logger.error(f"Error fetching XML for PMID {pmid}: {e}")
-                return None
+                root = ET.fromstring(xml_content)
+            except ET.ParseError as e:
+                logger.error(f"Error parsing batched XML: {e}")
+                continue
+
+            for article_elem in root.findall('PubmedArticle'):
+                pmid = article_elem.findtext('MedlineCitation/PMID')
+                if not pmid:
+                    continue
+                wrapper = ET.Element('PubmedArticleSet')
+                wrapper.append(article_elem)
+                results[pmid] = ET.tostring(wrapper, encoding='utf-8')
+
+        return results
+
+    async def batch_fetch(self, article_ids: List[str]) -> Dict[str, Optional[PubMedArticle]]:
+        """
+        Fetch multiple articles using batched EFetch requests.
+
+        Overrides the sequential base implementation: PMIDs are chunked into
+        groups of EFETCH_BATCH_SIZE, each chunk is retrieved with one
+        fetch_xml_batch call, and the returned PubmedArticleSet is split into
+        per-article subtrees. Only PMIDs missing from the batch response fall
+        back to individual fetch_by_id calls.
+
+        Args:
+            article_ids (List[str]): List of PubMed IDs (PMIDs)
+
+        Returns:
+            Dict[str, Optional[PubMedArticle]]: Dictionary mapping PMIDs to
+                                               their articles (or None if not found)
+
+        Examples:
+            >>> articles = await client.batch_fetch(["12345678", "87654321"])
+            >>> for pmid, article in articles.items():
+            ...     if article:
+            ...         print(f"{pmid}: {article.title}")
+        """
+        results: Dict[str, Optional[PubMedArticle]] = {
+            pmid: None for pmid in article_ids
+        }
+
+        for start in range(0, len(article_ids), self.EFETCH_BATCH_SIZE):
+            chunk = article_ids[start:start + self.EFETCH_BATCH_SIZE]
+            xml_content = await self.fetch_xml_batch(chunk)
+            if not xml_content:
+                continue
+
+            for article in self._parse_article_set(xml_content):
+                if article.pmid in results:
+                    results[article.pmid] = article
+
+        for pmid, article in results.items():
+            if article is None:
+                results[pmid] = await self.fetch_by_id(pmid)
+
+        return results
 
     async def batch_fetch_pdfs(self, article_ids: List[str]) -> Dict[str, Optional[bytes]]:
         """
@@ -289,7 +680,6 @@ class PubMedClient(BaseFetcher):
         results = await asyncio.gather(*tasks, return_exceptions=True)
         return dict(zip(article_ids, results))
 
-    @rate_limit()
     async def fetch_summary(self, pmid: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a summary of an article in JSON format.
@@ -308,23 +698,38 @@ class PubMedClient(BaseFetcher):
             >>> if summary:
             ...     print("Title:", summary.get("title"))
         """
+        cached_summary = self._summary_cache.get(pmid)
+        if cached_summary is not None:
+            logger.debug(f"Summary cache hit for PMID {pmid} "
+                         f"({self._summary_cache.hits} hits, "
+                         f"{self._summary_cache.misses} misses)")
+            return cached_summary
+
+        if self._cache is not None:
+            cached = self._cache.get('esummary', pmid)
+            if cached is not None:
+                data = json.loads(cached)
+                self._summary_cache.put(pmid, data)
+                return data
+
         url = f"{self.BASE_URL}/esummary.fcgi"
         params = {
-            **self._get_base_params(),
+            **self._base_params,
             'db': 'pubmed',
             'id': pmid,
             'retmode': 'json'
         }
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"Failed to fetch summary for PMID {
-                                     pmid}. Status: {response.status}")
-                        return None
-            except Exception as e:
-                logger.error(f"Error fetching summary for PMID {pmid}: {e}")
-                return None
+        content = await self._get_with_retries(url, params=params)
+        if content is None:
+            logger.error(f"Failed to fetch summary for PMID {pmid}")
+            return None
+        try:
+            data = json.loads(content)
+        except Exception as e:
+            logger.error(f"Error parsing summary for PMID {pmid}: {e}")
+            return None
+        self._summary_cache.put(pmid, data)
+        if self._cache is not None:
+            self._cache.set('esummary', pmid, content)
+        return data
@@ -1,6 +1,32 @@
-import xml.etree.ElementTree as ET
+import io
+import sys
+from dataclasses import asdict
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any, Union
+
+try:
+    # lxml runs find()/findall() descendant searches in libxml2 C code,
+    # which dominates parse_pubmed_article's cost on the stdlib parser.
+    from lxml import etree as ET
+    _USING_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _USING_LXML = False
+
+if _USING_LXML:
+    # One shared parser skips per-call parser construction on batches.
+    # PubMed XML needs neither xml:id collection nor entity resolution.
+    _PARSER = ET.XMLParser(remove_blank_text=True, collect_ids=False,
+                           resolve_entities=False, huge_tree=False)
+else:
+    _PARSER = None
+
+# PubMed month fields are either numeric or three-letter abbreviations;
+# a dict lookup is far cheaper than strptime's locale machinery.
+_MONTH_ABBREVS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
 
 from .types import (
     PubMedGrant, PubMedReference, PubMedAuthor,
@@ -8,6 +34,22 @@ from .types import (
 )
 
 
+def _intern_text(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a text value that recurs across many articles.
+
+    Agency names, countries, and MeSH descriptors repeat constantly in
+    batch ingests; interning dedupes them to one shared str object.
+
+    Args:
+        value (Optional[str]): Text to intern, possibly None or empty
+
+    Returns:
+        Optional[str]: The interned string, or the input unchanged if falsy
+    """
+    return sys.intern(value) if value else value
+
+
 class PubMedXMLParser:
     """
     A utility class for parsing PubMed XML data into structured Python objects.
@@ -16,27 +58,10 @@ class PubMedXMLParser:
     components including metadata, authors, references, grants, and MeSH headings. It provides
     methods to parse individual components as well as complete articles.
 
-    The parser uses ElementTree for XML processing and returns typed data structures
-    defined in the .types module.
+    The parser uses lxml for XML processing when available (falling back to
+    the stdlib ElementTree) and returns typed data structures defined in the
+    .types module.
     """
-    @staticmethod
-    def _get_text(element: Optional[ET.Element], xpath: str, default: str = "") -> str:
-        """
-        Safely extract text content from an XML element using an XPath expression.
-
-        Args:
-            element (Optional[ET.Element]): The XML element to search within
-            xpath (str): XPath expression to locate the desired element
-            default (str): Value to return if element or text is not found. Defaults to empty string
-
-        Returns:
-            str: Text content of the matching element or default value if not found
-        """
-        if element is None:
-            return default
-        found = element.find(xpath)
-        return found.text if found is not None and found.text else default
-
     @staticmethod
     def _parse_date(date_elem: Optional[ET.Element]) -> Optional[datetime]:
         """
@@ -49,7 +74,8 @@ class PubMedXMLParser:
             Optional[datetime]: Parsed datetime object, or None if parsing fails
 
         Note:
-            - If month is missing, defaults to January (1)
+            - Month may be numeric or a three-letter abbreviation ("Jan")
+            - If month is missing or unrecognized, defaults to January (1)
             - If day is missing, defaults to 1st of the month
             - Returns None if year is missing or invalid
         """
@@ -65,40 +91,54 @@ class PubMedXMLParser:
 
         try:
             year_val = int(year.text)
-            month_val = int(
-                month.text) if month is not None and month.text.isdigit() else 1
-            day_val = int(
-                day.text) if day is not None and day.text.isdigit() else 1
+        except (TypeError, ValueError):
+            return None
+
+        month_val = 1
+        if month is not None and month.text:
+            try:
+                month_val = int(month.text)
+            except ValueError:
+                month_val = _MONTH_ABBREVS.get(month.text, 1)
+
+        day_val = 1
+        if day is not None and day.text:
+            try:
+                day_val = int(day.text)
+            except ValueError:
+                day_val = 1
+
+        try:
             return datetime(year_val, month_val, day_val)
-        except (ValueError, AttributeError):
+        except ValueError:
             return None
 
     @classmethod
-    def parse_grants(cls, article_elem: ET.Element) -> List[PubMedGrant]:
+    def parse_grants(cls, grant_list: Optional[ET.Element]) -> List[PubMedGrant]:
         """
-        Parse grant information from a PubMed article XML element.
+        Parse grant information from a GrantList XML element.
 
         Args:
-            article_elem (ET.Element): XML element containing the article data
+            grant_list (Optional[ET.Element]): The article's GrantList element,
+                or None if the article has no grants
 
         Returns:
             List[PubMedGrant]: List of PubMedGrant objects containing grant information
 
         Example:
-            >>> grants = PubMedXMLParser.parse_grants(article_element)
+            >>> grants = PubMedXMLParser.parse_grants(article_element.find('GrantList'))
             >>> for grant in grants:
             ...     print(f"ID: {grant.grant_id}, Agency: {grant.agency}")
         """
         grants = []
-        grant_list = article_elem.find('.//GrantList')
 
         if grant_list is not None:
             for grant_elem in grant_list.findall('Grant'):
                 grant = PubMedGrant(
-                    grant_id=cls._get_text(grant_elem, 'GrantID'),
-                    acronym=cls._get_text(grant_elem, 'Acronym'),
-                    agency=cls._get_text(grant_elem, 'Agency'),
-                    country=cls._get_text(grant_elem, 'Country')
+                    grant_elem.findtext('GrantID', ''),
+                    grant_elem.findtext('Acronym', ''),
+                    _intern_text(grant_elem.findtext('Agency', '')),
+                    _intern_text(grant_elem.findtext('Country', ''))
                 )
                 grants.append(grant)
 
@@ -126,7 +166,7 @@ class PubMedXMLParser:
 
         if ref_list is not None:
             for ref_elem in ref_list.findall('Reference'):
-                citation = cls._get_text(ref_elem, 'Citation')
+                citation = ref_elem.findtext('Citation', '')
                 article_ids = ref_elem.find('ArticleIdList')
 
                 pmid = None
@@ -135,7 +175,7 @@ class PubMedXMLParser:
 
                 if article_ids is not None:
                     for id_elem in article_ids.findall('ArticleId'):
-                        id_type = id_elem.get('IdType', '')
+                        id_type = _intern_text(id_elem.get('IdType', ''))
                         if id_type == 'pubmed':
                             pmid = id_elem.text
                         elif id_type == 'doi':
@@ -143,36 +183,31 @@ class PubMedXMLParser:
                         elif id_type == 'pmc':
                             pmc_id = id_elem.text
 
-                reference = PubMedReference(
-                    citation=citation,
-                    pmid=pmid,
-                    doi=doi,
-                    pmc_id=pmc_id
-                )
+                reference = PubMedReference(citation, pmid, doi, pmc_id)
                 references.append(reference)
 
         return references
 
     @classmethod
-    def parse_authors(cls, article_elem: ET.Element) -> List[PubMedAuthor]:
+    def parse_authors(cls, author_list: Optional[ET.Element]) -> List[PubMedAuthor]:
         """
-        Parse author information from a PubMed article XML element.
+        Parse author information from an AuthorList XML element.
 
         Args:
-            article_elem (ET.Element): XML element containing the article data
+            author_list (Optional[ET.Element]): The article's AuthorList element,
+                or None if the article has no authors
 
         Returns:
             List[PubMedAuthor]: List of PubMedAuthor objects containing author details
                                including names and affiliations
 
         Example:
-            >>> authors = PubMedXMLParser.parse_authors(article_element)
+            >>> authors = PubMedXMLParser.parse_authors(article_element.find('AuthorList'))
             >>> for author in authors:
             ...     print(f"{author.last_name}, {author.fore_name}")
             ...     print(f"Affiliations: {', '.join(author.affiliations)}")
         """
         authors = []
-        author_list = article_elem.find('.//AuthorList')
 
         if author_list is not None:
             for author_elem in author_list.findall('Author'):
@@ -182,43 +217,42 @@ class PubMedXMLParser:
                 ]
 
                 author = PubMedAuthor(
-                    last_name=cls._get_text(author_elem, 'LastName'),
-                    fore_name=cls._get_text(author_elem, 'ForeName') or None,
-                    initials=cls._get_text(author_elem, 'Initials') or None,
-                    affiliations=affiliations
+                    author_elem.findtext('LastName', ''),
+                    author_elem.findtext('ForeName') or None,
+                    author_elem.findtext('Initials') or None,
+                    affiliations
                 )
                 authors.append(author)
 
         return authors
 
     @classmethod
-    def parse_journal(cls, article_elem: ET.Element) -> PubMedJournal:
+    def parse_journal(cls, journal_elem: Optional[ET.Element]) -> PubMedJournal:
         """
-        Parse journal metadata from a PubMed article XML element.
+        Parse journal metadata from a Journal XML element.
 
         Args:
-            article_elem (ET.Element): XML element containing the article data
+            journal_elem (Optional[ET.Element]): The article's Journal element,
+                or None if the article carries no journal information
 
         Returns:
             PubMedJournal: Object containing journal metadata including title,
                           abbreviation, ISSN, volume, and issue
 
         Example:
-            >>> journal = PubMedXMLParser.parse_journal(article_element)
+            >>> journal = PubMedXMLParser.parse_journal(article_element.find('Journal'))
             >>> print(f"{journal.title} ({journal.iso_abbreviation})")
             >>> print(f"Volume {journal.volume}, Issue {journal.issue}")
         """
-        journal_elem = article_elem.find('.//Journal')
         if journal_elem is None:
             return PubMedJournal("Unknown Journal", None, None, None, None)
 
         return PubMedJournal(
-            title=cls._get_text(journal_elem, 'Title'),
-            iso_abbreviation=cls._get_text(
-                journal_elem, 'ISOAbbreviation') or None,
-            issn=cls._get_text(journal_elem, 'ISSN') or None,
-            volume=cls._get_text(journal_elem, './/Volume') or None,
-            issue=cls._get_text(journal_elem, './/Issue') or None
+            journal_elem.findtext('Title', ''),
+            journal_elem.findtext('ISOAbbreviation') or None,
+            journal_elem.findtext('ISSN') or None,
+            journal_elem.findtext('JournalIssue/Volume') or None,
+            journal_elem.findtext('JournalIssue/Issue') or None
         )
 
     @classmethod
@@ -237,16 +271,16 @@ class PubMedXMLParser:
             Returns None for any date that cannot be parsed or is missing required elements
         """
         return PubMedDates(
-            completed=cls._parse_date(article_elem.find('.//DateCompleted')),
-            revised=cls._parse_date(article_elem.find('.//DateRevised')),
-            electronic_pub=cls._parse_date(
+            cls._parse_date(article_elem.find('.//DateCompleted')),
+            cls._parse_date(article_elem.find('.//DateRevised')),
+            cls._parse_date(
                 article_elem.find('.//ArticleDate[@DateType="Electronic"]')
             ),
-            pub_date=cls._parse_date(article_elem.find('.//PubDate'))
+            cls._parse_date(article_elem.find('.//PubDate'))
         )
 
     @classmethod
-    def parse_pubmed_article(cls, xml_content: str) -> Dict[str, Any]:
+    def parse_pubmed_article(cls, xml_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Parse a complete PubMed article XML into a structured dictionary.
 
@@ -255,7 +289,8 @@ class PubMedXMLParser:
         substances.
 
         Args:
-            xml_content (str): Complete PubMed article XML string
+            xml_content (Union[str, bytes]): Complete PubMed article XML.
+                Bytes are decoded by the parser using the XML declaration.
 
         Returns:
             Dict[str, Any]: Dictionary containing all parsed article data with the following keys:
@@ -288,29 +323,79 @@ class PubMedXMLParser:
             >>> print(f"Title: {article_data['title']}")
             >>> print(f"Authors: {len(article_data['authors'])}")
         """
-        root = ET.fromstring(xml_content)
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+
+        root = ET.fromstring(xml_content, _PARSER)
         article_set = root.find('.//PubmedArticle')
 
         if article_set is None:
             raise ValueError("No PubmedArticle element found in XML")
 
+        return cls._parse_article_elem(article_set)
+
+    @classmethod
+    def iter_pubmed_articles(
+            cls, xml_content: Union[str, bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream-parse a (multi-article) PubmedArticleSet one article at a time.
+
+        Instead of materializing the whole DOM of a batched EFetch response,
+        this iterates with iterparse and yields each article's metadata dict
+        as soon as its PubmedArticle element is complete, clearing the element
+        afterwards so peak memory stays at one article regardless of batch
+        size.
+
+        Args:
+            xml_content (Union[str, bytes]): PubmedArticleSet XML, possibly
+                containing many PubmedArticle elements
+
+        Yields:
+            Dict[str, Any]: Parsed article metadata, same shape as
+                           parse_pubmed_article
+
+        Example:
+            >>> for metadata in PubMedXMLParser.iter_pubmed_articles(batch_xml):
+            ...     print(metadata['pmid'])
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+
+        for _event, elem in ET.iterparse(io.BytesIO(xml_content), events=('end',)):
+            if elem.tag == 'PubmedArticle':
+                yield cls._parse_article_elem(elem)
+                elem.clear()
+
+    @classmethod
+    def _parse_article_elem(cls, article_set: ET.Element) -> Dict[str, Any]:
+        """
+        Extract the full metadata dictionary from one PubmedArticle element.
+
+        Args:
+            article_set (ET.Element): A complete PubmedArticle element
+
+        Returns:
+            Dict[str, Any]: Parsed article data (see parse_pubmed_article)
+        """
         medline_citation = article_set.find('MedlineCitation')
         article = medline_citation.find('Article')
 
-        journal = cls.parse_journal(article)
-        authors = cls.parse_authors(article)
+        # Locate each section once with direct-child lookups; the helpers
+        # then work on their own subtree instead of re-walking the article
+        # with descendant searches.
+        journal = cls.parse_journal(article.find('Journal'))
+        authors = cls.parse_authors(article.find('AuthorList'))
         dates = cls.parse_dates(article_set)
-        grants = cls.parse_grants(article)
+        grants = cls.parse_grants(article.find('GrantList'))
         references = cls.parse_references(article_set)
 
         return {
-            'pmid': cls._get_text(medline_citation, 'PMID'),
-            'title': cls._get_text(article, 'ArticleTitle'),
-            'abstract': cls._get_text(article, './/Abstract/AbstractText'),
-            'journal': journal.__dict__,
-            'authors': [author.__dict__ for author in authors],
-            'dates': {k: v.isoformat() if v else None
-                      for k, v in dates.__dict__.items()},
+            'pmid': medline_citation.findtext('PMID', ''),
+            'title': article.findtext('ArticleTitle', ''),
+            'abstract': article.findtext('.//Abstract/AbstractText', ''),
+            'journal': asdict(journal),
+            'authors': [asdict(author) for author in authors],
+            'dates': dates.as_iso(),
             'publication_types': [
                 pt.text for pt in article.findall('.//PublicationType')
             ],
@@ -319,11 +404,11 @@ class PubMedXMLParser:
             ],
             'mesh_headings': [
                 {
-                    'descriptor': desc.text,
+                    'descriptor': _intern_text(desc.text),
                     'major_topic': desc.get('MajorTopicYN', 'N') == 'Y',
                     'qualifiers': [
                         {
-                            'name': qual.text,
+                            'name': _intern_text(qual.text),
                             'major_topic': qual.get('MajorTopicYN', 'N') == 'Y'
                         }
                         for qual in mh.findall('QualifierName')
@@ -332,12 +417,12 @@ class PubMedXMLParser:
                 for mh in medline_citation.findall('.//MeshHeading')
                 if (desc := mh.find('DescriptorName')) is not None
             ],
-            'grants': [grant.__dict__ for grant in grants],
-            'references': [ref.__dict__ for ref in references],
+            'grants': [asdict(grant) for grant in grants],
+            'references': [asdict(ref) for ref in references],
             'chemicals': [
                 {
-                    'registry_number': cls._get_text(chem, 'RegistryNumber'),
-                    'substance_name': cls._get_text(chem, 'NameOfSubstance')
+                    'registry_number': chem.findtext('RegistryNumber', ''),
+                    'substance_name': chem.findtext('NameOfSubstance', '')
                 }
                 for chem in medline_citation.findall('.//Chemical')
             ]
@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PubMedGrant:
     """
     Data class representing a research grant associated with a PubMed article.
@@ -28,7 +28,7 @@ class PubMedGrant:
     country: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PubMedReference:
     """
     Data class representing a reference citation in a PubMed article.
@@ -53,7 +53,64 @@ class PubMedReference:
     pmc_id: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class PubMedMeshQualifier:
+    """
+    Data class representing a qualifier attached to a MeSH heading.
+
+    Attributes:
+        name (Optional[str]): Qualifier name (e.g. "genetics")
+        major_topic (bool): Whether the qualifier is a major topic of the article
+
+    Example:
+        >>> qualifier = PubMedMeshQualifier(name="genetics", major_topic=True)
+    """
+    name: Optional[str]
+    major_topic: bool
+
+
+@dataclass(slots=True, frozen=True)
+class PubMedMeshHeading:
+    """
+    Data class representing a MeSH heading assigned to a PubMed article.
+
+    Attributes:
+        descriptor (Optional[str]): MeSH descriptor name (e.g. "Neoplasms")
+        major_topic (bool): Whether the descriptor is a major topic of the article
+        qualifiers (List[PubMedMeshQualifier]): Qualifiers refining the descriptor
+
+    Example:
+        >>> heading = PubMedMeshHeading(
+        ...     descriptor="Neoplasms",
+        ...     major_topic=True,
+        ...     qualifiers=[PubMedMeshQualifier("genetics", False)]
+        ... )
+    """
+    descriptor: Optional[str]
+    major_topic: bool
+    qualifiers: List[PubMedMeshQualifier]
+
+
+@dataclass(slots=True, frozen=True)
+class PubMedChemical:
+    """
+    Data class representing a chemical substance listed for a PubMed article.
+
+    Attributes:
+        registry_number (str): CAS registry number or "0" if not assigned
+        substance_name (str): Name of the substance
+
+    Example:
+        >>> chemical = PubMedChemical(
+        ...     registry_number="11061-68-0",
+        ...     substance_name="Insulin"
+        ... )
+    """
+    registry_number: str
+    substance_name: str
+
+
+@dataclass(slots=True, frozen=True)
 class PubMedAuthor:
     """
     Data class representing an author of a PubMed article.
@@ -105,7 +162,7 @@ class PubMedAuthor:
         return self.last_name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PubMedJournal:
     """
     Data class representing a journal in which a PubMed article was published.
@@ -133,7 +190,7 @@ class PubMedJournal:
     issue: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PubMedDates:
     """
     Data class representing various dates associated with a PubMed article.
@@ -167,6 +224,51 @@ class PubMedDates:
     revised: Optional[datetime]
     electronic_pub: Optional[datetime]
     pub_date: Optional[datetime]
+    _as_iso: Optional[Dict[str, Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _best: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The dates are immutable, so the preference chain can be walked
+        # once at construction instead of on every get_best_date() call.
+        object.__setattr__(self, '_best', (self.pub_date or
+                                           self.electronic_pub or
+                                           self.completed or
+                                           self.revised))
+
+    def as_iso(self) -> Dict[str, Optional[str]]:
+        """
+        Get the dates as ISO format strings, computed once and cached.
+
+        The dates never change after construction, so repeated
+        serialization of the same article reuses one dict instead of
+        re-running isoformat() per date per call.
+
+        Returns:
+            Dict[str, Optional[str]]: ISO strings (or None) keyed by
+                                     completed/revised/electronic_pub/pub_date
+
+        Example:
+            >>> dates = PubMedDates(None, None, None, datetime(2020, 4, 1))
+            >>> dates.as_iso()['pub_date']
+            '2020-04-01T00:00:00'
+        """
+        cached = self._as_iso
+        if cached is None:
+            cached = {
+                'completed': self.completed.isoformat()
+                             if self.completed else None,
+                'revised': self.revised.isoformat() if self.revised else None,
+                'electronic_pub': self.electronic_pub.isoformat()
+                                  if self.electronic_pub else None,
+                'pub_date': self.pub_date.isoformat()
+                            if self.pub_date else None,
+            }
+            # The class is frozen; bypass the guard for this one private
+            # cache slot, which never affects equality or hashing.
+            object.__setattr__(self, '_as_iso', cached)
+        return cached
 
     def get_best_date(self) -> Optional[datetime]:
         """
@@ -181,7 +283,4 @@ class PubMedDates:
             >>> dates = PubMedDates(None, None, datetime(2020, 1, 1), None)
             >>> print(dates.get_best_date())  # 2020-01-01
         """
-        return (self.pub_date or
-                self.electronic_pub or
-                self.completed or
-                self.revised)
+        return self._best
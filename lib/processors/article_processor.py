@@ -1,14 +1,40 @@
+import asyncio
 import json
 from datetime import datetime
 import logging
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from ..fetchers.entrez.pubmed.client import PubMedClient
 from ..fetchers.entrez.pubmed.models import PubMedArticle
 from ..storage.local import LocalStorage
 
 logger = logging.getLogger(__name__)
 
+
+def _dump_json(obj: Dict[str, Any]) -> bytes:
+    """
+    Serialize a metadata dictionary to indented UTF-8 JSON bytes.
+
+    Uses orjson when available, which emits bytes directly from a C
+    encoder instead of building an intermediate Python string and
+    encoding it; otherwise falls back to the stdlib json module with
+    equivalent formatting.
+
+    Args:
+        obj (Dict[str, Any]): JSON-serializable dictionary
+
+    Returns:
+        bytes: Indented UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 class ArticleProcessor:
     """
     A processor class for searching, fetching, and storing PubMed articles with their associated metadata.
@@ -80,68 +106,69 @@ class ArticleProcessor:
             articles = await self.client.search(query, max_results=max_results)
             logger.info(f"Found {len(articles)} articles matching the query")
 
-            search_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # One clock read serves the search id, the search metadata, and
+            # every per-article saved_at stamp; re-reading the clock per
+            # record cost a syscall plus formatting for no information.
+            started = datetime.now()
+            started_iso = started.isoformat()
+
+            # ESearch should not repeat ids, but a duplicate PMID would
+            # otherwise be fetched and processed twice; dict.fromkeys
+            # dedupes while keeping result order.
+            pmids = list(dict.fromkeys(
+                article.pmid for article in articles))
+
+            search_id = started.strftime('%Y%m%d_%H%M%S')
             search_metadata = {
                 "search_id": search_id,
                 "query": query,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": started_iso,
                 "max_results": max_results,
                 "results_found": len(articles),
-                "pmids": [article.pmid for article in articles]
+                "pmids": pmids
             }
 
             await self.storage.save_file(
-                content=json.dumps(search_metadata, indent=2).encode('utf-8'),
+                content=_dump_json(search_metadata),
                 relative_path=f"metadata/searches/{search_id}.json",
                 metadata={"type": "search_results"}
             )
 
+            # Pull the XML for every result with batched EFetch calls up
+            # front; per-article round-trips then only happen for PMIDs
+            # missing from the batch responses.
+            xml_by_pmid = await self.client.fetch_many_xml(pmids)
+
+            # Each PMID is an independent I/O-bound workflow; run them
+            # concurrently, bounded so a large result set can't flood the
+            # client. The client's token bucket still paces the actual
+            # E-utilities requests.
+            semaphore = asyncio.Semaphore(8)
+
+            async def _bounded_process(article: 'PubMedArticle'):
+                async with semaphore:
+                    return await self._process_one(
+                        article, query, xml_by_pmid.get(article.pmid),
+                        saved_at=started_iso)
+
+            outcomes = await asyncio.gather(
+                *[_bounded_process(article) for article in articles],
+                return_exceptions=True
+            )
+
             results = []
             failed_pmids = []
 
-            for article in articles:
-                pmid = article.pmid
-                logger.info(f"\nProcessing search result PMID: {pmid}")
-
-                try:
-                    xml_content = await self.client.fetch_xml(pmid)
-                    if xml_content:
-                        full_article = await self.client.fetch_by_id(pmid)
-                        if full_article:
-                            self._log_article_details(full_article, query) 
-                            metadata = full_article.to_dict()
-
-                            if await self._save_metadata(metadata, pmid, "xml"):
-                                logger.info(
-                                    f"XML metadata saved for PMID {pmid}")
-
-                            try:
-                                summary_data = await self.client.fetch_summary(pmid)
-                                if summary_data:
-                                    await self._save_metadata(summary_data, pmid, "summary")
-                                    logger.info(
-                                        f"Summary metadata saved for PMID {pmid}")
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to fetch summary data: {e}")
-
-                            pdf_content = await self.client.fetch_pdf(pmid)
-                            if pdf_content:
-                                if await self._save_pdf(pdf_content, pmid, query):
-                                    logger.info(f"PDF saved for PMID {pmid}")
-                                else:
-                                    logger.warning(
-                                        f"Failed to save PDF for PMID {pmid}")
-
-                            results.append(metadata)
-                            continue
-
-                    failed_pmids.append(pmid)
-                    logger.warning(f"Failed to process PMID {pmid}")
-
-                except Exception as e:
-                    failed_pmids.append(pmid)
-                    logger.error(f"Error processing PMID {pmid}: {e}")
+            for article, outcome in zip(articles, outcomes):
+                if isinstance(outcome, BaseException):
+                    failed_pmids.append(article.pmid)
+                    logger.error(
+                        f"Error processing PMID {article.pmid}: {outcome}")
+                elif outcome is None:
+                    failed_pmids.append(article.pmid)
+                    logger.warning(f"Failed to process PMID {article.pmid}")
+                else:
+                    results.append(outcome)
 
             summary = {
                 "search_id": search_id,
@@ -155,8 +182,7 @@ class ArticleProcessor:
             }
 
             await self.storage.save_file(
-                content=json.dumps(summary, indent=2,
-                                   ensure_ascii=False).encode('utf-8'),
+                content=_dump_json(summary),
                 relative_path=f"metadata/searches/{search_id}_summary.json",
             )
 
@@ -170,7 +196,88 @@ class ArticleProcessor:
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def _save_metadata(self, metadata: Dict[str, Any], pmid: str, metadata_type: str = "xml") -> bool:
+    async def _process_one(self, article: 'PubMedArticle', query: str,
+                           xml_content: Optional[bytes] = None,
+                           saved_at: Optional[str] = None
+                           ) -> Optional[Dict[str, Any]]:
+        """
+        Process a single search result: fetch, log, and store its content.
+
+        Parses the article from prefetched batch XML when available (one
+        EFetch covers many PMIDs), falling back to a per-PMID fetch, then
+        saves the XML-derived metadata and fetches and saves the summary
+        data and PDF where available. Designed to run concurrently for
+        many PMIDs from search_and_process.
+
+        Args:
+            article (PubMedArticle): Search result article to process
+            query (str): Search query that found this article
+            xml_content (Optional[bytes], optional): Prefetched
+                single-article XML from a batched EFetch. Defaults to None.
+            saved_at (Optional[str], optional): ISO timestamp to stamp on
+                saved records, shared across the run. Defaults to None
+                (each save reads the clock itself).
+
+        Returns:
+            Optional[Dict[str, Any]]: The article's metadata dictionary on
+                success, or None if the article could not be fetched
+
+        Raises:
+            Exception: Propagates unexpected fetch/storage errors to the
+                caller, which records the PMID as failed
+        """
+        pmid = article.pmid
+        logger.info(f"\nProcessing search result PMID: {pmid}")
+
+        full_article = None
+        if xml_content:
+            try:
+                full_article = PubMedArticle.from_xml(xml_content)
+            except Exception as e:
+                logger.error(f"Error parsing batch XML for PMID {pmid}: {e}")
+
+        if full_article is None:
+            # One EFetch round-trip yields both the parsed article and its
+            # raw XML; fetching them separately doubled the rate-limited
+            # traffic.
+            full_article, _xml_content = await self.client.fetch_by_id_with_xml(pmid)
+        if not full_article:
+            return None
+
+        self._log_article_details(full_article, query)
+        metadata = full_article.to_dict()
+
+        if await self._save_metadata(metadata, pmid, "xml", saved_at):
+            logger.info(f"XML metadata saved for PMID {pmid}")
+
+        # The summary and PDF fetches are independent once the article is
+        # known to exist, so overlap their round-trips.
+        summary_data, pdf_content = await asyncio.gather(
+            self.client.fetch_summary(pmid),
+            self.client.fetch_pdf(pmid),
+            return_exceptions=True
+        )
+
+        if isinstance(summary_data, BaseException):
+            logger.warning(f"Failed to fetch summary data: {summary_data}")
+        elif summary_data:
+            await self._save_metadata(summary_data, pmid, "summary", saved_at)
+            logger.info(f"Summary metadata saved for PMID {pmid}")
+
+        if isinstance(pdf_content, BaseException):
+            logger.warning(
+                f"Failed to fetch PDF for PMID {pmid}: {pdf_content}")
+        elif pdf_content:
+            if await self._save_pdf(pdf_content, pmid, query, saved_at):
+                logger.info(f"PDF saved for PMID {pmid}")
+            else:
+                logger.warning(f"Failed to save PDF for PMID {pmid}")
+
+        return metadata
+
+    async def _save_metadata(self, metadata: Dict[str, Any], pmid: str,
+                             metadata_type: str = "xml",
+                             saved_at: Optional[str] = None) -> bool:
         """
         Save article metadata to storage with enhanced information.
 
@@ -178,14 +285,16 @@ class ArticleProcessor:
             metadata (Dict[str, Any]): Article metadata to save
             pmid (str): PubMed ID of the article
             metadata_type (str, optional): Type of metadata ('xml' or 'summary'). Defaults to "xml".
+            saved_at (Optional[str], optional): ISO timestamp to record.
+                Defaults to None (the current time is used).
 
         Returns:
             bool: True if save was successful, False otherwise
 
         Note:
             - Enhances original metadata with timestamp and type information
-            - Saves as JSON with UTF-8 encoding
-            - Creates metadata directory structure: metadata/{metadata_type}/{pmid}.json
+            - Appends one PMID-keyed record to the metadata/{metadata_type}.jsonl
+              shard instead of creating one small file per article
 
         Example:
             >>> success = await processor._save_metadata(
@@ -195,19 +304,14 @@ class ArticleProcessor:
             ... )
         """
         try:
-            metadata_path = f"metadata/{metadata_type}/{pmid}.json"
             enhanced_metadata = {
                 **metadata,
-                "saved_at": datetime.now().isoformat(),
+                "saved_at": saved_at or datetime.now().isoformat(),
                 "metadata_type": metadata_type
             }
 
-            content = json.dumps(enhanced_metadata, indent=2,
-                                 ensure_ascii=False).encode('utf-8')
-            return await self.storage.save_file(
-                content=content,
-                relative_path=metadata_path,
-            )
+            return await self.storage.append_record(
+                metadata_type, pmid, enhanced_metadata)
         except Exception as e:
             logger.error(f"Error saving {
                          metadata_type} metadata for PMID {pmid}: {e}")
@@ -229,27 +333,38 @@ class ArticleProcessor:
             query (str): Search query that found this article
 
         Note:
-            Uses the logging module to output information at INFO level
+            Uses the logging module to output information at INFO level.
+            Skips all formatting work when INFO is not enabled.
         """
+        # One level check instead of formatting a dozen messages (and
+        # joining a potentially long keyword list) that the logger would
+        # then discard.
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         logger.info("Article details:")
-        logger.info(f"Found by query: '{query}'")
-        logger.info(f"Title: {article.title}")
-        logger.info(f"DOI: {article.doi}")
-        logger.info(f"Journal: {article.journal}")
-        logger.info(f"Authors: {len(article.authors)} contributors")
-        logger.info(f"Keywords: {', '.join(
-            article.keywords) if article.keywords else 'None'}")
-
-        if hasattr(article, 'author_details') and article.author_details:
+        logger.info("Found by query: '%s'", query)
+        logger.info("Title: %s", article.title)
+        logger.info("DOI: %s", article.doi)
+        logger.info("Journal: %s", article.journal)
+        logger.info("Authors: %d contributors", len(article.authors))
+        logger.info("Keywords: %s",
+                    ', '.join(article.keywords)
+                    if article.keywords else 'None')
+
+        # PubMedArticle declares these in __slots__ and every constructor
+        # path assigns them, so plain truthiness checks suffice.
+        if article.author_details:
             logger.info("Author affiliations available")
 
-        if hasattr(article, 'mesh_headings') and article.mesh_headings:
-            logger.info(f"MeSH Headings: {len(article.mesh_headings)}")
+        if article.mesh_headings:
+            logger.info("MeSH Headings: %d", len(article.mesh_headings))
 
-        if hasattr(article, 'references') and article.references:
-            logger.info(f"References: {len(article.references)} citations")
+        if article.references:
+            logger.info("References: %d citations", len(article.references))
 
-    async def _save_pdf(self, pdf_content: bytes, pmid: str, query: str) -> bool:
+    async def _save_pdf(self, pdf_content: bytes, pmid: str, query: str,
+                        saved_at: Optional[str] = None) -> bool:
         """
         Save PDF content to storage with associated metadata.
 
@@ -257,6 +372,8 @@ class ArticleProcessor:
             pdf_content (bytes): Binary PDF content
             pmid (str): PubMed ID of the article
             query (str): Search query that found this article
+            saved_at (Optional[str], optional): ISO timestamp to record.
+                Defaults to None (the current time is used).
 
         Returns:
             bool: True if save was successful, False otherwise
@@ -279,7 +396,7 @@ class ArticleProcessor:
             pdf_path = f"pdfs/{pmid}.pdf"
             pdf_metadata = {
                 "pmid": pmid,
-                "saved_at": datetime.now().isoformat(),
+                "saved_at": saved_at or datetime.now().isoformat(),
                 "file_size": len(pdf_content),
                 "search_context": {
                     "query": query
@@ -1,3 +1,5 @@
-from .rate_limit import rate_limit
+from .rate_limit import rate_limit, AsyncTokenBucket
+from .disk_cache import DiskCache
+from .lru import LRUCache
 
-__all__ = ["rate_limit"]
\ No newline at end of file
+__all__ = ["rate_limit", "AsyncTokenBucket", "DiskCache", "LRUCache"]
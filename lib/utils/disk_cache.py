@@ -0,0 +1,83 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class DiskCache:
+    """
+    A persistent byte cache on the local filesystem.
+
+    Entries are keyed by a namespace (e.g. the API endpoint) and a string
+    key (e.g. a PMID) and stored as flat files fanned out over the first
+    two hex digits of the key's SHA-1, so repeated runs against the same
+    identifiers read bytes from disk instead of re-downloading them.
+    Writes go through a temporary file and os.replace, so a concurrent
+    reader never observes a partially-written entry.
+
+    Args:
+        root (str): Directory that holds the cache tree
+        ttl (Optional[float], optional): Maximum entry age in seconds.
+            Entries older than this are treated as missing. Defaults to
+            None (entries never expire).
+
+    Examples:
+        >>> cache = DiskCache("cache", ttl=7 * 24 * 3600)
+        >>> cache.set("efetch", "12345678", xml_bytes)
+        >>> cached = cache.get("efetch", "12345678")
+    """
+
+    def __init__(self, root: str, ttl: Optional[float] = None):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """
+        Compute the on-disk path for a cache entry.
+
+        Args:
+            namespace (str): Cache namespace
+            key (str): Entry key within the namespace
+
+        Returns:
+            Path: Path of the entry file, existing or not
+        """
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.root / namespace / digest[:2] / f"{digest}.bin"
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """
+        Read an entry, honoring the cache TTL.
+
+        Args:
+            namespace (str): Cache namespace
+            key (str): Entry key within the namespace
+
+        Returns:
+            Optional[bytes]: Cached bytes, or None if the entry is missing
+                            or older than the configured TTL
+        """
+        path = self._path(namespace, key)
+        try:
+            if (self.ttl is not None
+                    and time.time() - path.stat().st_mtime > self.ttl):
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set(self, namespace: str, key: str, data: bytes) -> None:
+        """
+        Write an entry atomically.
+
+        Args:
+            namespace (str): Cache namespace
+            key (str): Entry key within the namespace
+            data (bytes): Bytes to store
+        """
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache:
+    """
+    A small in-memory least-recently-used cache.
+
+    Backed by an OrderedDict that moves entries to the end on access and
+    evicts from the front once maxsize is exceeded. Intended for
+    per-process memoization of hot keys (e.g. parsed articles by PMID)
+    inside a single asyncio event loop: no operation crosses an await
+    point, so access is safe without a lock. Hit/miss counters are kept
+    so callers can log the hit rate when debugging.
+
+    Args:
+        maxsize (int): Maximum number of entries to retain
+
+    Examples:
+        >>> cache = LRUCache(maxsize=4096)
+        >>> cache.put("12345678", article)
+        >>> cache.get("12345678") is article
+        True
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Look up a key, refreshing its recency on a hit.
+
+        Args:
+            key (Any): Cache key
+
+        Returns:
+            Optional[Any]: Cached value, or None if the key is missing
+        """
+        entries = self._entries
+        value = entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Insert or refresh an entry, evicting the oldest one when full.
+
+        Args:
+            key (Any): Cache key
+            value (Any): Value to store
+        """
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
@@ -1,29 +1,92 @@
 import asyncio
 import time
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
 
-def rate_limit(delay: float = 0.34):
+class AsyncTokenBucket:
+    """
+    An asyncio-friendly token-bucket rate limiter shared across callers.
+
+    Unlike the per-decorator state in :func:`rate_limit`, a single bucket
+    instance can be shared by every method that talks to the same API host,
+    so interleaved calls (e.g. fetch_xml + fetch_summary) are paced against
+    one common quota instead of one quota per method.
+
+    Args:
+        rate (float): Sustained token refill rate in tokens per second
+        capacity (float, optional): Maximum burst size in tokens. Defaults to 1.0.
+
+    Examples:
+        >>> limiter = AsyncTokenBucket(rate=3, capacity=3)
+        >>> async def fetch():
+        ...     await limiter.acquire()
+        ...     # API call here
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until the requested number of tokens is available, then consume them.
+
+        Args:
+            tokens (float, optional): Number of tokens to consume. Defaults to 1.0.
+
+        Note:
+            Waiters are serialized through an asyncio.Lock, so tokens are
+            handed out fairly in acquisition order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+def rate_limit(delay: float = 0.34,
+               bucket: Optional[AsyncTokenBucket] = None):
     """
     A decorator that implements rate limiting for asynchronous function calls.
 
     This decorator ensures a minimum time interval between successive function calls,
-    helping to prevent API rate limit violations. It can use either a default delay
-    or a dynamic delay from an instance's request_delay attribute.
+    helping to prevent API rate limit violations. When given a shared
+    AsyncTokenBucket, every decorated function draws from that one bucket, so
+    different methods talking to the same host are paced against a single
+    quota; otherwise it falls back to a per-function minimum delay using
+    either the default or a dynamic delay from an instance's request_delay
+    attribute.
 
     Args:
         delay (float, optional): Default minimum time between calls in seconds.
-                               Defaults to 0.34 seconds.
+                               Defaults to 0.34 seconds. Ignored when a
+                               bucket is given.
+        bucket (Optional[AsyncTokenBucket], optional): Shared token bucket to
+                               acquire from instead of per-function spacing.
+                               Defaults to None.
 
     Returns:
         Callable: Decorated function with rate limiting applied
 
     Features:
-        - Supports both default and instance-specific delay times
+        - Supports shared-bucket, default, and instance-specific pacing
         - Uses asyncio.sleep for non-blocking delays
         - Preserves function metadata through @wraps
-        - Thread-safe using nonlocal state
+        - Uses monotonic time, immune to wall-clock adjustments
 
     Examples:
         Basic usage with default delay:
@@ -32,8 +95,9 @@ def rate_limit(delay: float = 0.34):
         ...     # API call here
         ...     pass
 
-        Usage with custom delay:
-        >>> @rate_limit(delay=1.0)
+        Sharing one quota across several functions:
+        >>> NCBI_BUCKET = AsyncTokenBucket(rate=3, capacity=3)
+        >>> @rate_limit(bucket=NCBI_BUCKET)
         ... async def fetch_data():
         ...     # API call here
         ...     pass
@@ -42,19 +106,27 @@ def rate_limit(delay: float = 0.34):
         >>> class APIClient:
         ...     def __init__(self):
         ...         self.request_delay = 0.5
-        ...     
+        ...
         ...     @rate_limit()
         ...     async def fetch_data(self):
         ...         # Will use self.request_delay instead of default
         ...         pass
 
     Note:
-        - The decorator checks for a request_delay attribute on the first argument
-          (typically self in methods) and uses that value if available
-        - Time tracking is done using time.time() for high precision
+        - Without a bucket, the decorator checks for a request_delay attribute
+          on the first argument (typically self in methods) and uses that
+          value if available
         - The delay is implemented using asyncio.sleep for non-blocking behavior
     """
     def decorator(func: Callable) -> Callable:
+        if bucket is not None:
+            @wraps(func)
+            async def bucket_wrapper(*args: Any, **kwargs: Any) -> Any:
+                await bucket.acquire()
+                return await func(*args, **kwargs)
+
+            return bucket_wrapper
+
         last_call = 0.0
 
         @wraps(func)
@@ -65,13 +137,13 @@ def rate_limit(delay: float = 0.34):
             if args and hasattr(args[0], 'request_delay'):
                 instance_delay = args[0].request_delay
 
-            current_time = time.time()
+            current_time = time.monotonic()
             time_since_last = current_time - last_call
 
             if time_since_last < instance_delay:
                 await asyncio.sleep(instance_delay - time_since_last)
 
-            last_call = time.time()
+            last_call = time.monotonic()
             return await func(*args, **kwargs)
 
         return wrapper